@@ -1,15 +1,20 @@
 """deserialization tools"""
 import typing as t
 from datetime import datetime
-from functools import partial
 
-from toolz import flip
 from valuable import load
 
 from . import types
 
+
+def parse_datetime(value: str) -> datetime:
+    """parse a github timestamp, e.g. ``2017-11-20T07:16:29Z``"""
+    # github timestamps are always UTC, with a literal 'Z' suffix
+    return datetime.fromisoformat(value[:-1])
+
+
 registry = load.PrimitiveRegistry({
-    datetime: partial(flip(datetime.strptime),  '%Y-%m-%dT%H:%M:%SZ'),
+    datetime: parse_datetime,
     **{
         c: c for c in [
             int,
@@ -1,25 +1,25 @@
 """the main API"""
 import abc
-import json
-import reprlib
+import enum
 import typing as t
 from datetime import datetime
-from functools import singledispatch
-from operator import methodcaller
+from types import MappingProxyType
 
 from dataclasses import dataclass
 
 import snug
 
+try:
+    from orjson import loads as load_json
+except ImportError:
+    from json import loads as load_json
+
 from .types import (Repo, Issue, RepoSummary, Organization,
-                    OrganizationSummary, User)
+                    OrganizationSummary, User, _Frozen)
 from .load import registry
 
 API_PREFIX = 'https://api.github.com/'
-HEADERS = {'Accept': 'application/vnd.github.v3+json'}
-
-_repr = reprlib.Repr()
-_repr.maxstring = 45
+HEADERS = MappingProxyType({'Accept': 'application/vnd.github.v3+json'})
 
 execute = snug.execute
 execute_async = snug.execute_async
@@ -31,20 +31,35 @@ class ApiError(Exception):
     pass
 
 
-@singledispatch
-def dump_param(val):
-    """dump a query param value"""
-    return str(val)
+def dump_datetime(value: t.Union[str, datetime]) -> str:
+    """dump a query param value which may be given as a datetime"""
+    if not isinstance(value, datetime):
+        return str(value)
+    # formatted by hand: considerably faster than strftime()
+    return (f'{value.year:04d}-{value.month:02d}-{value.day:02d}T'
+            f'{value.hour:02d}:{value.minute:02d}:{value.second:02d}Z')
+
 
+def dump_choice(value: t.Union[str, enum.Enum]) -> str:
+    """dump a query param value which may be given as an enum member"""
+    return value.value if isinstance(value, enum.Enum) else value
 
-dump_param.register(datetime, methodcaller('strftime', '%Y-%m-%dT%H:%M:%SZ'))
 
+# the param names are the same across queries, so their dumpers are
+# looked up by name, instead of dispatching on the type of each value.
+PARAM_DUMPERS = {
+    'filter': dump_choice,
+    'state':  dump_choice,
+    'sort':   dump_choice,
+    'since':  dump_datetime,
+}
 
-def prepare_params(request):
-    """prepare request parameters"""
-    return request.replace(
-        params={key: dump_param(val) for key, val in request.params.items()
-                if val is not None})
+
+def dump_params(params):
+    """dump request parameters, leaving out empty values"""
+    return {key: PARAM_DUMPERS.get(key, str)(val)
+            for key, val in params.items()
+            if val is not None}
 
 
 T = t.TypeVar('T')
@@ -52,13 +67,14 @@ T = t.TypeVar('T')
 
 class BaseQuery(snug.Query[T]):
     """Base query functionality"""
+    __slots__ = ()
 
     @staticmethod
     def prepare(request):
-        return prepare_params(
-            request
-            .with_prefix(API_PREFIX)
-            .with_headers(HEADERS))
+        # a single copy, instead of one for each of the prefix/headers/params
+        return request.replace(url=API_PREFIX + request.url,
+                               params=dump_params(request.params),
+                               headers={**request.headers, **HEADERS})
 
     def __iter__(self):
         response = yield self.prepare(self.request)
@@ -69,7 +85,7 @@ class BaseQuery(snug.Query[T]):
         """check for errors"""
         if response.status_code == 400:
             try:
-                msg = json.loads(response.content)['message']
+                msg = load_json(response.content)['message']
             except (KeyError, ValueError):
                 msg = ''
             raise ApiError(msg)
@@ -78,25 +94,36 @@ class BaseQuery(snug.Query[T]):
 
 class Retrieval(BaseQuery[T]):
     """base for retrieval queries"""
+    __slots__ = ()
+
     @abc.abstractproperty
     def type(self): pass
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # resolve the loader once per class, instead of for each response
+        cls.load = staticmethod(registry(cls.type))
+
     def parse(self, response):
         parsed = super().parse(response)
-        loader = registry(self.type)
-        return loader(json.loads(parsed.content))
+        return self.load(load_json(parsed.content))
 
 
-@dataclass
-class repo(Retrieval):
+@dataclass(frozen=True)
+class repo(Retrieval, _Frozen):
     """repository lookup by owner & name"""
+    __slots__ = ('name', 'owner', 'path')
     type = Repo
     name:  str
     owner: str
 
+    def __post_init__(self):
+        # shared by the related queries, so only formatted once
+        object.__setattr__(self, 'path', f'repos/{self.owner}/{self.name}')
+
     @property
     def request(self):
-        return snug.GET(f'repos/{self.owner}/{self.name}')
+        return snug.GET(self.path)
 
     @snug.related
     @dataclass
@@ -110,22 +137,25 @@ class repo(Retrieval):
         @property
         def request(self):
             return snug.GET(
-                f'repos/{self.repo.owner}/{self.repo.name}/issues',
+                f'{self.repo.path}/issues',
                 params={'labels': self.labels, 'state':  self.state})
 
     @snug.related
-    @dataclass
-    class issue(Retrieval):
+    @dataclass(frozen=True)
+    class issue(Retrieval, _Frozen):
         """get a specific issue in the repo"""
+        __slots__ = ('repo', 'number', 'path')
         type = Issue
         repo: 'repo'
         number: int
 
+        def __post_init__(self):
+            object.__setattr__(self, 'path',
+                               f'{self.repo.path}/issues/{self.number}')
+
         @property
         def request(self):
-            return snug.GET(
-                f'repos/{self.repo.owner}/'
-                f'{self.repo.name}/issues/{self.number}')
+            return snug.GET(self.path)
 
         @snug.related
         @dataclass
@@ -137,15 +167,14 @@ class repo(Retrieval):
 
             @property
             def request(self):
-                return snug.GET(
-                    f'repos/{self.issue.repo.owner}/{self.issue.repo.name}/'
-                    f'issues/{self.issue.number}/comments',
-                    params={'since': self.since})
+                return snug.GET(f'{self.issue.path}/comments',
+                                params={'since': self.since})
 
 
 @dataclass
 class repos(Retrieval):
     """list of repositories"""
+    __slots__ = ()
     type = t.List[RepoSummary]
     request = snug.GET('repositories')
 
@@ -153,6 +182,7 @@ class repos(Retrieval):
 @dataclass
 class org(Retrieval):
     """Organization lookup by login"""
+    __slots__ = ('login', )
     type = Organization
     login: str
 
@@ -164,6 +194,7 @@ class org(Retrieval):
 @dataclass
 class orgs(Retrieval):
     """a selection of organizations"""
+    __slots__ = ()
     type = t.List[OrganizationSummary]
     request = snug.GET('organizations')
 
@@ -192,11 +223,13 @@ class issues(Retrieval):
 @dataclass
 class current_user(Retrieval):
     """a reference to the current user"""
+    __slots__ = ()
     type = User
     request = snug.GET('user')
 
     @dataclass
     class issues(Retrieval):
+        __slots__ = ()
         type = t.List[Issue]
         request = snug.GET('user/issues')
 
@@ -207,6 +240,7 @@ CURRENT_USER = current_user()
 @dataclass
 class user(Retrieval):
     """retrieve a user by username"""
+    __slots__ = ('username', )
     type = User
     username: str
 
@@ -218,6 +252,7 @@ class user(Retrieval):
     @dataclass
     class follow(BaseQuery):
         """follow this user"""
+        __slots__ = ('user', )
         user: 'user'
 
         @property
@@ -232,6 +267,7 @@ class user(Retrieval):
     @dataclass
     class following(BaseQuery):
         """check if following this user"""
+        __slots__ = ('user', )
         user: 'user'
 
         @property
@@ -245,6 +281,7 @@ class user(Retrieval):
     @dataclass
     class unfollow(BaseQuery):
         """unfollow this user"""
+        __slots__ = ('user', )
         user: 'user'
 
         @property
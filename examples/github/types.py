@@ -1,21 +1,38 @@
 """datastructures and type definitions"""
 import enum
-import reprlib
 import typing as t
 from datetime import datetime
 from functools import partial
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
-_repr = reprlib.Repr()
-_repr.maxstring = 45
+
+def _shorten(text: t.Optional[str], maxlen: int=45) -> str:
+    """repr of an optional string, truncated to a maximum length"""
+    if text is not None and len(text) > maxlen:
+        text = text[:maxlen - 3] + '...'
+    return repr(text)
 
 
 dclass = partial(dataclass, frozen=True, repr=False)
 
 
+class _Frozen:
+    """base for frozen dataclasses with hand-written ``__slots__``.
+
+    Their slots can't be restored with (frozen) ``setattr`` on copying
+    and unpickling, so instances are re-initialized from their fields.
+    """
+    __slots__ = ()
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, f.name) for f in fields(self))
+
+
 @dclass()
-class UserSummary:
+class UserSummary(_Frozen):
+    __slots__ = ('login', 'id', 'avatar_url', 'gravatar_id', 'html_url',
+                 'type', 'site_admin')
     login:       str
     id:          int
     avatar_url:  str
@@ -31,6 +48,8 @@ class UserSummary:
 
 @dclass()
 class User(UserSummary):
+    __slots__ = ('bio', 'blog', 'company', 'created_at', 'email', 'location',
+                 'name', 'repos_url', 'updated_at', 'url')
     bio:        str
     blog:       str
     company:    str
@@ -47,7 +66,9 @@ class User(UserSummary):
 
 
 @dclass()
-class RepoSummary:
+class RepoSummary(_Frozen):
+    __slots__ = ('id', 'owner', 'name', 'full_name', 'description', 'private',
+                 'fork', 'url', 'html_url')
     id:          int
     owner:       UserSummary
     name:        str
@@ -59,11 +80,14 @@ class RepoSummary:
     html_url:    str
 
     def __repr__(self):
-        return f'<RepoSummary: {self.name} | {_repr.repr(self.description)}>'
+        return f'<RepoSummary: {self.name} | {_shorten(self.description)}>'
 
 
 @dclass()
 class Repo(RepoSummary):
+    __slots__ = ('created_at', 'default_branch', 'homepage', 'language',
+                 'open_issues_count', 'pushed_at', 'size', 'stargazers_count',
+                 'updated_at', 'watchers_count')
     created_at:        datetime
     default_branch:    str
     description:       str
@@ -83,8 +107,9 @@ class Repo(RepoSummary):
 
 
 @dclass()
-class OrganizationSummary:
+class OrganizationSummary(_Frozen):
     """basic details of a github organization"""
+    __slots__ = ('id', 'description', 'login')
     id:          int
     description: t.Optional[str]
     login:       str
@@ -93,6 +118,7 @@ class OrganizationSummary:
 @dclass()
 class Organization(OrganizationSummary):
     """a github organization"""
+    __slots__ = ('blog', 'created_at', 'name', 'repos_url', 'type')
     blog:        t.Optional[str]
     created_at:  t.Optional[datetime]
     name:        t.Optional[str]
@@ -104,10 +130,11 @@ class Organization(OrganizationSummary):
 
 
 @dclass()
-class Issue:
+class Issue(_Frozen):
     """a github issue or pull-request"""
+    __slots__ = ('number', 'title', 'body', 'state')
 
-    class State(enum.Enum):
+    class State(str, enum.Enum):
         OPEN = 'open'
         CLOSED = 'closed'
         ALL = 'all'
@@ -120,12 +147,12 @@ class Issue:
     def __repr__(self):
         return f'<Issue: #{self.number} {self.title}>'
 
-    class Sort(enum.Enum):
+    class Sort(str, enum.Enum):
         CREATED = 'created'
         UPDATED = 'updated'
         COMMENTS = 'comments'
 
-    class Filter(enum.Enum):
+    class Filter(str, enum.Enum):
         ASSIGNED = 'assigned'
         CREATED = 'created'
         MENTIONED = 'mentioned'
@@ -133,8 +160,9 @@ class Issue:
         ALL = 'all'
 
     @dclass
-    class Comment:
+    class Comment(_Frozen):
         """an issue comment"""
+        __slots__ = ('id', 'user', 'body')
         id:   int
         user: UserSummary
         body: str
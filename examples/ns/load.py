@@ -1,21 +1,119 @@
 """deserialization tools"""
+import enum
 import typing as t
 from datetime import datetime
-from functools import partial
+from xml.etree.ElementTree import Element
 
-from toolz import compose, flip, valmap
+from toolz import valmap
 from valuable import load, xml
 
 from . import types
 
+
+def parse_datetime(value: str) -> datetime:
+    """parse an NS timestamp, e.g. ``2018-01-22T21:49:00+0100``"""
+    # fast path: before python 3.11, fromisoformat()
+    # only accepts UTC offsets with a colon (i.e. +01:00)
+    try:
+        return datetime.fromisoformat(value[:-2] + ':' + value[-2:])
+    except ValueError:
+        return datetime.strptime(value, '%Y-%m-%dT%H:%M:%S%z')
+
+
+_REQUIRED = object()
+
+
+def textgetter(path: str, *,
+               default: t.Any=_REQUIRED) -> t.Callable[[Element], str]:
+    """make a getter for the text of the element at ``path``,
+    raising LookupError if it is missing (unless a default is given)"""
+    # multi-step paths are split up front: single-tag lookups are
+    # handled directly by the C accelerator, unlike ElementPath expressions
+    *steps, tag = path.split('/')
+
+    def get(elem: Element) -> str:
+        for step in steps:
+            elem = elem.find(step)
+            if elem is None:
+                break
+        else:
+            text = elem.findtext(tag)
+            if text is not None:
+                return text
+        if default is _REQUIRED:
+            raise LookupError(path)
+        return default
+
+    return get
+
+
+def textsgetter(path: str) -> t.Callable[[Element], t.List[str]]:
+    """make a getter for the texts of all elements at ``path``"""
+    *steps, tag = path.split('/')
+
+    def get(elem: Element) -> t.List[str]:
+        for step in steps:
+            elem = elem.find(step)
+            if elem is None:
+                return []
+        return [e.text for e in elem.findall(tag)]
+
+    return get
+
+
+def attribgetter(path: str, name: str, *,
+                 default: t.Any=_REQUIRED) -> t.Callable[[Element], str]:
+    """make a getter for attribute ``name`` of the element at ``path``,
+    raising LookupError if it is missing (unless a default is given)"""
+    steps = [] if path == '.' else path.split('/')
+
+    def get(elem: Element) -> str:
+        for step in steps:
+            elem = elem.find(step)
+            if elem is None:
+                break
+        else:
+            try:
+                return elem.attrib[name]
+            except KeyError:
+                pass
+        if default is _REQUIRED:
+            raise LookupError(f'{path}/@{name}')
+        return default
+
+    return get
+
+
+def get_stop_time(elem: Element) -> t.Optional[str]:
+    """get the time of a journey stop, which is empty if unknown"""
+    text = elem.findtext('Tijd')
+    if text is None:
+        raise LookupError('Tijd')
+    return text or None
+
+
+def _member_lookup(cls: t.Type[enum.Enum]) -> t.Callable[[str], enum.Enum]:
+    """a loader of enum members by value, faster than calling the enum.
+    Unknown values are still passed to the enum, for its error message"""
+    members = {m.value: m for m in cls}
+
+    def load_member(value):
+        try:
+            return members[value]
+        except KeyError:
+            return cls(value)
+
+    return load_member
+
+
 registry = load.PrimitiveRegistry({
     bool:     dict(true=True, false=False).__getitem__,
-    datetime: partial(flip(datetime.strptime), '%Y-%m-%dT%H:%M:%S%z'),
+    datetime: parse_datetime,
     str:      str.strip,
+    int:      int,
+    float:    float,
     **{
-        c: c for c in [
-            int,
-            float,
+        c: _member_lookup(c) for c in [
             types.Journey.Status,
             types.Journey.Component.Status
         ]
@@ -23,7 +121,7 @@ registry = load.PrimitiveRegistry({
 }) | load.GenericRegistry({
     t.List: load.list_loader,
 }) | load.get_optional_loader | load.DataclassRegistry({
-    types.Station: {**valmap(xml.textgetter, {
+    types.Station: {**valmap(textgetter, {
         'code':       'Code',
         'type':       'Type',
         'country':    'Land',
@@ -34,9 +132,9 @@ registry = load.PrimitiveRegistry({
         'full_name':  'Namen/Lang',
         'short_name': 'Namen/Kort',
     }), **{
-        'synonyms':   xml.textsgetter('Synoniemen/Synoniem'),
+        'synonyms':   textsgetter('Synoniemen/Synoniem'),
     }},
-    types.Journey: {**valmap(xml.textgetter, {
+    types.Journey: {**valmap(textgetter, {
         'transfer_count':    'AantalOverstappen',
         'planned_duration':  'GeplandeReisTijd',
         'planned_departure': 'GeplandeVertrekTijd',
@@ -49,9 +147,9 @@ registry = load.PrimitiveRegistry({
         'components':        xml.elemsgetter('ReisDeel'),
         'notifications':     xml.elemsgetter('Melding'),
     }, **{
-        'optimal':           xml.textgetter('Optimaal', default='false')
+        'optimal':           textgetter('Optimaal', default='false')
     }},
-    types.Departure: {**valmap(xml.textgetter, {
+    types.Departure: {**valmap(textgetter, {
         'ride_number':      'RitNummer',
         'time':             'VertrekTijd',
         'destination':      'EindBestemming',
@@ -59,33 +157,32 @@ registry = load.PrimitiveRegistry({
         'carrier':          'Vervoerder',
         'platform':         'VertrekSpoor',
     }), **{
-        'platform_changed': xml.attribgetter('VertrekSpoor', 'wijziging'),
-        'comments':         xml.textsgetter('Opmerkingen/Opmerking'),
-        'delay':            xml.textgetter('VertrekVertragingTekst',
-                                           default=None),
-        'travel_tip':       xml.textgetter('ReisTip', default=None),
-        'route_text':       xml.textgetter('RouteTekst', default=None),
+        'platform_changed': attribgetter('VertrekSpoor', 'wijziging'),
+        'comments':         textsgetter('Opmerkingen/Opmerking'),
+        'delay':            textgetter('VertrekVertragingTekst',
+                                       default=None),
+        'travel_tip':       textgetter('ReisTip', default=None),
+        'route_text':       textgetter('RouteTekst', default=None),
     }},
-    types.Journey.Component: {**valmap(xml.textgetter, {
+    types.Journey.Component: {**valmap(textgetter, {
         'carrier':     'Vervoerder',
         'type':        'VervoerType',
         'ride_number': 'RitNummer',
         'status':      'Status',
     }), **{
-        'details':     xml.textsgetter('Reisdetails/Reisdetail'),
-        'kind':        xml.attribgetter('.', 'reisSoort'),
+        'details':     textsgetter('Reisdetails/Reisdetail'),
+        'kind':        attribgetter('.', 'reisSoort'),
         'stops':       xml.elemsgetter('ReisStop'),
     }},
     types.Journey.Component.Stop: {
-        'name':             xml.textgetter('Naam'),
-        'time':             compose(lambda x: x or None,
-                                    xml.textgetter('Tijd')),
-        'platform_changed': xml.attribgetter('Spoor', 'wijziging',
-                                             default=None),
-        'delay':            xml.textgetter('VertrekVertraging', default=None),
-        'platform':         xml.textgetter('Spoor', default=None)
+        'name':             textgetter('Naam'),
+        'time':             get_stop_time,
+        'platform_changed': attribgetter('Spoor', 'wijziging',
+                                         default=None),
+        'delay':            textgetter('VertrekVertraging', default=None),
+        'platform':         textgetter('Spoor', default=None)
     },
-    types.Journey.Notification: valmap(xml.textgetter, {
+    types.Journey.Notification: valmap(textgetter, {
         'id':      'Id',
         'serious': 'Ernstig',
         'text':    'Text',
@@ -2,11 +2,9 @@
 import typing as t
 import xml.etree.ElementTree
 from datetime import datetime
-from functools import singledispatch
-from operator import attrgetter, methodcaller
+from functools import wraps
 
-from gentools import (compose, map_return, map_send, map_yield, oneyield,
-                      reusable)
+from gentools import reusable
 
 import snug
 
@@ -14,8 +12,6 @@ from .load import registry as loads
 from .types import Departure, Journey, Station
 
 API_PREFIX = 'https://webservices.ns.nl/ns-api-'
-parse_request = compose(xml.etree.ElementTree.fromstring,
-                        attrgetter('content'))
 
 
 execute = snug.execute
@@ -24,31 +20,56 @@ executor = snug.executor
 async_executor = snug.async_executor
 
 
-@singledispatch
-def dump_param(val):
-    """dump a query param value"""
-    return str(val)
+def dump_datetime(value: datetime) -> str:
+    """dump a datetime query param value"""
+    # formatted by hand: considerably faster than strftime()
+    return (f'{value.year:04d}-{value.month:02d}-{value.day:02d}T'
+            f'{value.hour:02d}:{value.minute:02d}')
+
 
+# dumpers by type, others are dumped with str()
+PARAM_DUMPERS = {datetime: dump_datetime}
 
-dump_param.register(datetime, methodcaller('strftime', '%Y-%m-%dT%H:%M'))
+
+def dump_param(value) -> str:
+    """dump a query param value"""
+    dumper = PARAM_DUMPERS.get(type(value))
+    if dumper is None:
+        # subclasses (e.g. of datetime) use the dumper of their base
+        dumper = next((PARAM_DUMPERS[cls] for cls in type(value).__mro__
+                       if cls in PARAM_DUMPERS), str)
+    return dumper(value)
 
 
 def prepare_params(req: snug.Request) -> snug.Request:
     """prepare request parameters"""
+    if not req.params:
+        return req
     return req.replace(
         params={key: dump_param(val) for key, val in req.params.items()
                 if val is not None})
 
 
+def parse_request(response: snug.Response) -> xml.etree.ElementTree.Element:
+    """parse the XML content of a response"""
+    return xml.etree.ElementTree.fromstring(response.content)
+
+
 def basic_query(returns):
     """decorator factory for NS queries"""
-    return compose(
-        reusable,
-        map_send(parse_request),
-        map_yield(prepare_params, snug.prefix_adder(API_PREFIX)),
-        map_return(loads(returns)),
-        oneyield,
-    )
+    load = loads(returns)
+
+    def decorator(func):
+        # a single generator, instead of a stack of wrapping generators
+        @wraps(func)
+        def query(*args, **kwargs):
+            request = func(*args, **kwargs).with_prefix(API_PREFIX)
+            response = yield prepare_params(request)
+            return load(parse_request(response))
+
+        return reusable(query)
+
+    return decorator
 
 
 @basic_query(t.List[Station])
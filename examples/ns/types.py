@@ -5,13 +5,28 @@ from datetime import datetime
 from functools import partial
 from operator import attrgetter
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 dclass = partial(dataclass, frozen=True, repr=False)
 
 
+class _SlotState:
+    # slotted instances restore their state with setattr by default,
+    # which the frozen dataclasses don't allow
+    __slots__ = ()
+
+    def __getstate__(self):
+        return [getattr(self, f.name) for f in fields(self)]
+
+    def __setstate__(self, state):
+        for f, value in zip(fields(self), state):
+            object.__setattr__(self, f.name, value)
+
+
 @dclass()
-class Station:
+class Station(_SlotState):
+    __slots__ = ('name', 'full_name', 'short_name', 'code', 'type', 'country',
+                 'uic', 'lat', 'lon', 'synonyms')
     name:       str
     full_name:  str
     short_name: str
@@ -31,8 +46,11 @@ class Station:
 
 
 @dclass()
-class Departure:
+class Departure(_SlotState):
     """a train departure"""
+    __slots__ = ('ride_number', 'time', 'delay', 'destination', 'train_type',
+                 'route_text', 'carrier', 'platform', 'platform_changed',
+                 'travel_tip', 'comments')
     ride_number:      int
     time:             datetime
     delay:            t.Optional[str]
@@ -55,12 +73,18 @@ class Departure:
 
 
 @dclass()
-class Journey:
+class Journey(_SlotState):
     """a journey option"""
+    __slots__ = ('transfer_count', 'planned_duration', 'planned_departure',
+                 'planned_arrival', 'actual_duration', 'actual_departure',
+                 'actual_arrival', 'optimal', 'components', 'notifications',
+                 'status')
 
     @dclass()
-    class Component:
+    class Component(_SlotState):
         """a journey option component"""
+        __slots__ = ('kind', 'carrier', 'type', 'ride_number', 'status',
+                     'details', 'stops')
 
         class Status(enum.Enum):
             """status of a journey component"""
@@ -75,8 +99,10 @@ class Journey:
                 return f'Status.{self.name}'
 
         @dclass()
-        class Stop:
+        class Stop(_SlotState):
             """a travel stop on a journey component"""
+            __slots__ = ('name', 'time', 'delay', 'platform',
+                         'platform_changed')
             name:             str
             time:             t.Optional[datetime]
             delay:            t.Optional[str]
@@ -109,8 +135,9 @@ class Journey:
             return f'<Component: {text}>'
 
     @dclass()
-    class Notification:
+    class Notification(_SlotState):
         """an notification about a journey option"""
+        __slots__ = ('id', 'serious', 'text')
         id:      t.Optional[str]
         serious: bool
         text:    str
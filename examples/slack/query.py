@@ -1,11 +1,14 @@
 """common logic for all queries"""
 import json
-from functools import partial, singledispatch
-from operator import itemgetter
+from functools import partial, wraps
 
 import snug
-from gentools import (compose, map_yield, map_send, oneyield, reusable,
-                      map_return)
+from gentools import compose, map_yield, relay, reusable
+
+try:
+    from orjson import loads as load_json
+except ImportError:
+    from json import loads as load_json
 
 from .load import registry
 
@@ -20,30 +23,32 @@ def _parse_content(response):
     """parse the response body as JSON, raise on errors"""
     if response.status_code != 200:
         raise ApiError(f'unknown error: {response.content.decode()}')
-    result = json.loads(response.content)
+    result = load_json(response.content)
     if not result['ok']:
         raise ApiError(f'{result["error"]}: {result.get("detail")}')
     return result
 
 
-basic_interaction = compose(map_yield(snug.prefix_adder(API_URL)),
-                            map_send(_parse_content))
-"""basic request/response parsing"""
+def _basic_interaction(request):
+    """basic request/response parsing"""
+    return _parse_content((yield request.with_prefix(API_URL)))
 
 
-@singledispatch
-def _dump_queryparam_value(val):
-    return str(val)
+basic_interaction = relay(_basic_interaction)
+basic_interaction.__doc__ = _basic_interaction.__doc__
 
 
-@_dump_queryparam_value.register(bool)
 def _dump_bool_value(val):
     return 'true' if val else 'false'
 
 
+# dumpers by exact type, others are dumped with str()
+_QUERYPARAM_DUMPERS = {bool: _dump_bool_value}
+
+
 def _dump_params(params):
-    return {k: _dump_queryparam_value(v) for k, v in params.items()
-            if v is not None}
+    return {k: _QUERYPARAM_DUMPERS.get(type(v), str)(v)
+            for k, v in params.items() if v is not None}
 
 
 def paginated_retrieval(methodname, itemtype):
@@ -61,13 +66,19 @@ def _params_as_get(methodname: str, params: dict) -> snug.Request:
 
 def json_post(methodname, rtype, key):
     """decorator factory for json POST queries"""
-    return compose(
-        reusable,
-        map_return(registry(rtype), itemgetter(key)),
-        basic_interaction,
-        map_yield(partial(_json_as_post, methodname)),
-        oneyield,
-    )
+    load = registry(rtype)
+
+    def decorator(func):
+        # delegates with yield from, instead of a stack of wrapping generators
+        @wraps(func)
+        def query(*args, **kwargs):
+            request = _json_as_post(methodname, func(*args, **kwargs))
+            result = yield from _basic_interaction(request)
+            return load(result[key])
+
+        return reusable(query)
+
+    return decorator
 
 
 def _json_as_post(methodname: str, body: dict) -> snug.Request:
@@ -1,4 +1,6 @@
+import copy
 import json
+import pickle
 from pathlib import Path
 from datetime import datetime
 
@@ -63,6 +65,14 @@ async def test_one_repo(exec):
         assert isinstance(repo, gh.Repo)
         assert repo.name == 'hub'
 
+    # offline test
+    with pytest.raises(AttributeError):
+        one_repo.name = 'other'
+    for clone in [copy.deepcopy(one_repo),
+                  pickle.loads(pickle.dumps(one_repo))]:
+        assert clone == one_repo
+        assert next(iter(clone)).url.endswith('repos/github/hub')
+
 
 @pytest.mark.asyncio
 async def test_assigned_issues(exec):
@@ -75,6 +85,17 @@ async def test_assigned_issues(exec):
         assert len(issues) > 1
         assert isinstance(issues[0], gh.Issue)
 
+    # offline test
+    filtered = gh.issues(state=gh.Issue.State.OPEN,
+                         sort=gh.Issue.Sort.CREATED,
+                         since=datetime(2018, 1, 1, 2, 3, 4))
+    assert next(iter(filtered)).params == {
+        'state': 'open',
+        'sort': 'created',
+        'since': '2018-01-01T02:03:04Z'}
+    assert next(iter(gh.issues(since='2018-01-01'))).params == {
+        'since': '2018-01-01'}
+
 
 @pytest.mark.asyncio
 async def test_current_user(exec):
@@ -113,6 +134,14 @@ async def test_one_repo_issue(exec):
 
         assert isinstance(issue, gh.Issue)
 
+    # offline test
+    with pytest.raises(AttributeError):
+        one_repo_issue.number = 124
+    clone = pickle.loads(pickle.dumps(one_repo_issue))
+    assert clone == one_repo_issue
+    assert next(iter(clone.comments())).url.endswith(
+        'repos/github/hub/issues/123/comments')
+
 
 @pytest.mark.asyncio
 async def test_filtered_repo_issues(exec):
@@ -148,3 +177,14 @@ async def test_follow_user(exec):
         assert await exec(user.follow())
         assert await exec(user.unfollow())
         assert not await exec(user.following())
+
+
+def test_issue_copy_and_pickle():
+    issue = gh.load.registry(gh.Issue)({
+        'number': 348,
+        'title': 'Hello',
+        'body': 'world',
+        'state': 'open',
+    })
+    assert copy.deepcopy(issue) == issue
+    assert pickle.loads(pickle.dumps(issue)) == issue
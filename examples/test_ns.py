@@ -1,4 +1,7 @@
+import copy
 import json
+import pickle
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import aiohttp
@@ -87,6 +90,36 @@ async def test_journey_options(exec):
         'toStation': 'Amsterdam',
         'hslAllowed': 'false'}
 
+    class Moment(datetime):
+        pass
+
+    at_moment = travel_options.replace(time=Moment(2018, 1, 1, 2, 3))
+    assert next(iter(at_moment)).params['dateTime'] == '2018-01-01T02:03'
+
+
+def test_parse_datetime():
+    without_colon = ns.load.parse_datetime('2018-01-22T21:49:00+0100')
+    with_colon = ns.load.parse_datetime('2018-01-22T21:49:00+01:00')
+
+    assert without_colon == with_colon
+    assert without_colon.utcoffset() == timedelta(hours=1)
+    assert with_colon.utcoffset() == timedelta(hours=1)
+
+
+def test_unknown_journey_status():
+    load_status = ns.load.registry(ns.Journey.Status)
+    assert load_status('VERTRAAGD') is ns.Journey.Status.DELAYED
+    with pytest.raises(ValueError, match='bogus'):
+        load_status('bogus')
+
+
+def test_journey_copy_and_pickle():
+    query = iter(ns.journey_options(origin='Breda', destination='Amsterdam'))
+    next(query)
+    journey = sendreturn(query, snug.Response(200, content=JOURNEYS_SAMPLE))[0]
+    assert copy.deepcopy(journey) == journey
+    assert pickle.loads(pickle.dumps(journey)) == journey
+
 
 STATIONS_SAMPLE = b'''\
 <Stations>
@@ -41,12 +41,12 @@ class _SlotsMixin(object):
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self._asdict() == other._asdict()
+            return self._astuple == other._astuple
         return NotImplemented
 
     def __ne__(self, other):
         if isinstance(other, self.__class__):
-            return self._asdict() != other._asdict()
+            return self._astuple != other._astuple
         return NotImplemented
 
     def replace(self, **kwargs):
@@ -57,7 +57,9 @@ class _SlotsMixin(object):
         **kwargs
             fields and values to replace
         """
-        return type(self)(**_merge_maps(self._asdict(), kwargs))
+        attrs = self._asdict()
+        attrs.update(kwargs)
+        return type(self)(**attrs)
 
 
 def _merge_maps(m1, m2):
@@ -84,6 +86,7 @@ class Request(_SlotsMixin):
 
     __slots__ = "method", "url", "content", "params", "headers"
     __hash__ = None
+    _astuple = property(attrgetter(*__slots__))
 
     def __init__(
         self,
@@ -151,6 +154,7 @@ class Response(_SlotsMixin):
 
     __slots__ = "status_code", "content", "headers"
     __hash__ = None
+    _astuple = property(attrgetter(*__slots__))
 
     def __init__(self, status_code, content=None, headers=_FrozenDict()):
         self.status_code = status_code